@@ -0,0 +1,87 @@
+"""
+Hot-path text helpers for the GialloZafferano scraper.
+======================================================
+
+These functions run for every ingredient, step and list card, and only
+manipulate strings, so they are kept in this small, fully type-annotated
+module that can be compiled to a C extension with mypyc:
+
+    pip install mypy
+    mypyc _fast.py
+
+The compiled module is picked up automatically by `import _fast`; without
+it, the same code simply runs as plain Python.
+"""
+
+import re
+from typing import List, Optional, Pattern, Tuple
+from urllib.parse import urljoin
+
+# Whitespace runs, and a space left before a period or comma
+WHITESPACE_RE: Pattern[str] = re.compile(r'\s+')
+PUNCT_SPACE_RE: Pattern[str] = re.compile(r' ([.,])')
+
+# Numeric difficulty rating of a list card footer item ("2", "4.5")
+RATING_RE: Pattern[str] = re.compile(r'\d+(?:\.\d+)?')
+
+def clean_data(text: Optional[str]) -> str:
+    """
+    Standardizes whitespace and fixes common punctuation spacing issues.
+
+    Args:
+        text (str or None): The raw text to clean.
+
+    Returns:
+        str: Cleaned text or empty string if input is None.
+    """
+    if not text:
+        return ""
+    return PUNCT_SPACE_RE.sub(r'\1', WHITESPACE_RE.sub(' ', text).strip())
+
+def join_description(fragments: List[str]) -> str:
+    """
+    Joins the description text fragments, removing the trailing colons
+    (that introduce the ingredient list) from the last fragment.
+    """
+    if fragments:
+        fragments[-1] = fragments[-1].replace(":", "")
+    return clean_data(" ".join(fragments))
+
+def parse_footer(items: List[str]) -> Tuple[str, str, str]:
+    """
+    Extracts prep time, calories and difficulty rating from the footer items
+    of a list card, classifying each item text on its own.
+
+    Time and calorie items keep their whole text ("30 min prep",
+    "1 h e 30 min"); an item is a rating only if it is entirely a number,
+    so e.g. "4 porzioni" is ignored.
+
+    Returns:
+        tuple: (prep_time, calories, rating), "Not Available" when missing.
+    """
+    prep_time, calories, rating = "Not Available", "Not Available", "Not Available"
+    for text in items:
+        if "min" in text or "h" in text:
+            prep_time = text
+        elif "Kcal" in text:
+            calories = text.replace("Kcal", "").replace(",", ".").strip()
+        else:
+            value = text.replace(",", ".").strip()
+            if RATING_RE.fullmatch(value):
+                rating = value
+    return prep_time, calories, rating
+
+def absolute_url(base_url: str, href: Optional[str]) -> str:
+    """
+    Resolves a link found on a page of `base_url` (scheme and host only,
+    no trailing slash).
+
+    GialloZafferano links are mostly root-relative ('/ricette-cat/page2/'),
+    for which plain concatenation gives the same result as urljoin without
+    parsing both URLs; anything else goes through urljoin.
+    """
+    # '//' is a protocol-relative link and '/.' may start a dot segment,
+    # both need urljoin's full resolution
+    if href and href.startswith('/') and not href.startswith('//') and '/.' not in href:
+        return base_url + href
+    return urljoin(base_url, href)
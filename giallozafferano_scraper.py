@@ -6,50 +6,188 @@ This script scrapes Italian recipes from GialloZafferano.it.
 It performs an incremental scrape:
 1. Iterates through recipe category pages.
 2. Extracts recipe metadata (title, URL, difficulty, prep time, etc.).
-3. Checks if the recipe already exists in the local MongoDB database.
-4. If new, visits the detail page to extract ingredients and instructions.
-5. Saves data immediately to MongoDB to prevent data loss.
+3. Checks which recipes of the page already exist in the local MongoDB database.
+4. Queues the new ones in a persistent URL frontier (a MongoDB collection).
+5. Workers claim queued recipes, visit the detail page to extract
+   ingredients and instructions, and save them to MongoDB in small batches.
+
+The frontier makes the crawl resumable: recipes queued by an interrupted run
+are picked up by the next one, and several instances can run side by side
+since workers claim their recipes atomically.
+
+All pages are fetched concurrently over a single shared aiohttp session;
+HTML parsing runs in a worker thread so it never blocks the event loop.
 
 Dependencies:
 - pymongo: Database interaction
-- scrapling: Efficient scraping session handling
+- aiohttp: Concurrent HTTP fetching
+- scrapling: HTML parsing and CSS selection
+- selectolax (optional): Faster Lexbor-based parsing of the detail pages
+- mypy (optional): Compiles the _fast.py text helpers with mypyc
+- Brotli (optional): Lets the server send brotli-compressed pages
 """
 
-import re
+import os
 import json
+import socket
 import time
+import asyncio
 import logging
+from datetime import datetime, timedelta, timezone
 from urllib.parse import urljoin
-from pymongo import MongoClient
-from scrapling.fetchers import FetcherSession
+import aiohttp
+from pymongo import MongoClient, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+from scrapling.parser import Selector
+
+# String helpers, optionally compiled with mypyc (see _fast.py)
+from _fast import absolute_url, clean_data, join_description, parse_footer
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional fast path, scrapling is used otherwise
+    LexborHTMLParser = None
+
+# aiohttp decodes brotli responses when one of these packages is installed
+try:
+    import brotli  # noqa: F401
+    HAS_BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        HAS_BROTLI = True
+    except ImportError:
+        HAS_BROTLI = False
 
 # --- CONFIGURATION & LOGGING ---
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+# Set GZ_LOG_LEVEL=WARNING to silence the per-page progress on long crawls
+LOG_LEVEL = (os.environ.get('GZ_LOG_LEVEL') or 'INFO').upper()
+# getLevelName maps known level names to their number
+LOG_LEVEL_VALID = isinstance(logging.getLevelName(LOG_LEVEL), int)
+logging.basicConfig(level=LOG_LEVEL if LOG_LEVEL_VALID else 'INFO', format='%(levelname)s: %(message)s')
+if not LOG_LEVEL_VALID:
+    logging.warning("Unknown GZ_LOG_LEVEL %r, using INFO", LOG_LEVEL)
 
 # MongoDB Connection
 client = MongoClient('mongodb://localhost:27017/')
 db = client['recipes_new']
 collection = db['italian_giallozafferano']
 
+# Recipe batches keep the default acknowledged write concern (w=1) on purpose.
+# With w=0 write errors go unnoticed, and a lost batch is never scraped again:
+# batches are written newest-first, so it is older than the recipes already
+# stored, and the next incremental run stops before reaching it.
+
+# URL frontier: recipes waiting to be scraped.
+# Documents: {url, title, meta, status: 'pending'|'in-progress'|'done'|'failed',
+#             discovered_at, scraped_at, attempts, worker_id, claimed_at}
+frontier = db['frontier']
+
+# Upper bound on in-flight requests, to stay polite with the server
+MAX_CONCURRENT_REQUESTS = 8
+
+# Number of workers scraping recipes from the frontier, per process
+WORKER_COUNT = MAX_CONCURRENT_REQUESTS
+
+# Claims older than this are considered left over by a crashed run
+CLAIM_TIMEOUT = timedelta(minutes=10)
+
+# A recipe whose scrape fails is put back in the queue until it has been
+# claimed this many times, then left 'failed'
+MAX_SCRAPE_ATTEMPTS = 3
+
+# How long (seconds) an idle worker waits before polling the frontier again
+FRONTIER_POLL_INTERVAL = 1.0
+
+# Number of list pages fetched ahead of the one being processed
+LIST_PAGE_PREFETCH = 3
+
+# Idle keep-alive connections and resolved DNS entries are kept this long
+# (seconds), so TCP/TLS handshakes and lookups are paid once per host
+KEEPALIVE_TIMEOUT = 300
+DNS_CACHE_TTL = 300
+
+# Per-request total timeout (seconds), and bounded retries on connection
+# errors, timeouts and 429/5xx responses (same defaults as scrapling's
+# FetcherSession, which the scraper used before aiohttp)
+REQUEST_TIMEOUT = 30
+FETCH_ATTEMPTS = 3
+RETRY_DELAY = 1
+
+# Minimum spacing (seconds) between the start of two requests. This keeps the
+# same budget as sleeping 1.2s per request in each of the 8 slots, but the
+# wait happens before dispatch instead of holding a slot idle after it.
+REQUEST_INTERVAL = 1.2 / MAX_CONCURRENT_REQUESTS
+
+# Recipe pages are ~200KB of HTML (~30KB gzipped): anything smaller than this
+# is an error or placeholder page and is not worth parsing
+MIN_RECIPE_PAGE_SIZE = 4096
+
+# Number of scraped recipes buffered before a bulk write to MongoDB
+INSERT_BATCH_SIZE = 100
+
+# Browser-like headers (aiohttp's default User-Agent is often blocked)
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+    "Accept-Language": "it-IT,it;q=0.9,en;q=0.8",
+    # Pages are ~200KB of HTML that compress to ~30KB: always ask for compression
+    "Accept-Encoding": "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate",
+}
+
+# Hosts whose response compression has already been logged
+encoding_checked_hosts = set()
+
 # Ensure 'url' is indexed for fast lookups during the incremental check
 collection.create_index("url", unique=True)
+frontier.create_index("url", unique=True)
+frontier.create_index([("status", 1), ("discovered_at", 1)])
+
+# CSS selectors for the recipe detail page. Kept at module level so every
+# page reuses the same strings, and with them scrapling's cached
+# CSS-to-XPath translations.
+SEL_CONTENT = 'div.gz-content-recipe.gz-mBottom4x'
+SEL_DESCRIPTION = 'p:not(.gz-translation-link) ::text'
+SEL_INGREDIENT_SECTIONS = 'dl.gz-list-ingredients'
+SEL_INGREDIENT_GROUP = '.gz-title-ingredients'
+SEL_INGREDIENT = '.gz-ingredient'
+SEL_STEPS = 'div.gz-content-recipe-step'
+# The step's own text plus the text of its descendants, minus step numbers
+SEL_STEP_TEXT = SEL_STEPS + '::text, ' + SEL_STEPS + ' *:not(.num-step)::text'
 
 # --- HELPER FUNCTIONS ---
 
-def clean_data(text):
+class Throttle:
     """
-    Standardizes whitespace and fixes common punctuation spacing issues.
+    Async context manager enforcing the politeness policy for every request:
+    at most `max_concurrent` requests in flight, and request starts spaced by
+    at least `interval` seconds (gated on time.monotonic()).
     
-    Args:
-        text (str): The raw text to clean.
-        
-    Returns:
-        str: Cleaned text or empty string if input is None.
+    Parsing happens outside the throttle, so it overlaps with the next fetch.
     """
-    if not text: 
-        return ""
-    text = " ".join(text.split())
-    return text.replace(" .", ".").replace(" ,", ",")
+    def __init__(self, max_concurrent, interval):
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.interval = interval
+        self.next_slot = time.monotonic()
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        # Reserve the next free time slot, then wait for it
+        now = time.monotonic()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval
+        if slot > now:
+            try:
+                await asyncio.sleep(slot - now)
+            except BaseException:
+                # Cancelled while waiting: __aexit__ will not run, so give
+                # the slot back here
+                self.semaphore.release()
+                raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.semaphore.release()
 
 def parse_ingredients(recipe_page):
     """
@@ -57,28 +195,29 @@ def parse_ingredients(recipe_page):
     
     Returns a list of dictionaries, where each dictionary represents a group 
     (e.g., "For the dough") and contains a list of ingredient items.
-    Optimal for Mongo.
+    Optimal for Mongo. Items are collected as (name, quantity) tuples and
+    turned into dicts once per group.
     """
     ingredients_list = []
-    sections = recipe_page.css('dl.gz-list-ingredients')
+    sections = recipe_page.css(SEL_INGREDIENT_SECTIONS)
     
     for section in sections:
-        title_node = section.css_first('.gz-title-ingredients')
+        title_node = section.css_first(SEL_INGREDIENT_GROUP)
         cat_name = clean_data(title_node.text) if title_node else "Ingredienti di base"
         
         items_in_group = []
-        for item in section.css('.gz-ingredient'):
+        for item in section.css(SEL_INGREDIENT):
             name_node = item.css_first('a')
             qty_node = item.css_first('span')
             
-            items_in_group.append({
-                "item": clean_data(name_node.text) if name_node else "N/A",
-                "quantity": clean_data(qty_node.text) if qty_node else "q.b."
-            })
+            items_in_group.append((
+                clean_data(name_node.text) if name_node else "N/A",
+                clean_data(qty_node.text) if qty_node else "q.b."
+            ))
         
         ingredients_list.append({
             "group": cat_name,
-            "items": items_in_group
+            "items": [{"item": name, "quantity": qty} for name, qty in items_in_group]
         })
     return ingredients_list
 
@@ -87,169 +226,584 @@ def parse_instructions(recipe_page):
     Extracts recipe steps and joins them into a single continuous paragraph.
     This format is optimized for RAG (Retrieval-Augmented Generation) applications.
     """
-    steps = []
-    containers = recipe_page.css('div.gz-content-recipe-step')
-    for container in containers:
-        # Exclude step numbers to keep text clean
-        fragments = container.css('*:not(.num-step)::text').get_all()
-        step_text = clean_data(" ".join(fragments))
-        if step_text:
-            steps.append(step_text)
+    # One page-wide query for the text of all steps, excluding step numbers
+    # to keep text clean. Whitespace is collapsed anyway, so there is no need
+    # to split the fragments back into single steps.
+    fragments = recipe_page.css(SEL_STEP_TEXT).get_all()
+    return clean_data(" ".join(fragments))
+
+def parse_recipe_content(recipe_page):
+    """
+    Extracts description, ingredients, instructions and related recipes
+    from a recipe page parsed by scrapling.
+    
+    Returns:
+        dict: The extracted fields, or None if the page has no recipe content.
+    """
+    content_div = recipe_page.css_first(SEL_CONTENT)
+    if not content_div:
+        return None
+
+    # Related Recipes extraction
+    related = []
+    related_section = content_div.css('li')
+    for r in related_section:
+        r_name = r.css('::text').get()
+        a_tag = r.css_first('a')
+        r_url = a_tag.attrib.get('href') if a_tag else None
+        if r_name and r_url:
+            related.append({"name": r_name.strip(), "url": r_url})
+
+    return {
+        "description": join_description(content_div.css(SEL_DESCRIPTION).get_all()),
+        "ingredients": parse_ingredients(recipe_page),
+        "instructions": parse_instructions(recipe_page),
+        "related_recipes": related,
+    }
+
+# --- SELECTOLAX (LEXBOR) FAST PATH ---
+# Same extraction as above on selectolax's Lexbor tree, which parses the
+# ~200KB detail pages several times faster than lxml. Lexbor has no
+# '::text' pseudo-element, so text nodes are collected by walking the tree.
+
+def lexbor_text_fragments(node):
+    """Returns all text nodes below `node`, in document order."""
+    return [n.text(deep=False) for n in node.traverse(include_text=True) if n.tag == '-text']
+
+def lexbor_own_text(node):
+    """
+    Returns the text of `node` before its first child element, like lxml's
+    (and scrapling's) `.text`.
+    """
+    child = node.child
+    return child.text(deep=False) if child is not None and child.tag == '-text' else ""
+
+def lexbor_has_class(node, class_name):
+    return class_name in (node.attributes.get('class') or "").split()
+
+def parse_ingredients_lexbor(tree):
+    """Lexbor version of parse_ingredients."""
+    ingredients_list = []
+    for section in tree.css(SEL_INGREDIENT_SECTIONS):
+        title_node = section.css_first(SEL_INGREDIENT_GROUP)
+        cat_name = clean_data(lexbor_own_text(title_node)) if title_node else "Ingredienti di base"
+        
+        items_in_group = []
+        for item in section.css(SEL_INGREDIENT):
+            name_node = item.css_first('a')
+            qty_node = item.css_first('span')
+            
+            items_in_group.append((
+                clean_data(lexbor_own_text(name_node)) if name_node else "N/A",
+                clean_data(lexbor_own_text(qty_node)) if qty_node else "q.b."
+            ))
+        
+        ingredients_list.append({
+            "group": cat_name,
+            "items": [{"item": name, "quantity": qty} for name, qty in items_in_group]
+        })
+    return ingredients_list
+
+def parse_instructions_lexbor(tree):
+    """Lexbor version of parse_instructions."""
+    fragments = []
+    for step in tree.css(SEL_STEPS):
+        # Text of the step and its descendants, excluding step numbers
+        fragments.extend(
+            n.text(deep=False) for n in step.traverse(include_text=True)
+            if n.tag == '-text' and not lexbor_has_class(n.parent, 'num-step')
+        )
+    return clean_data(" ".join(fragments))
+
+def parse_recipe_content_lexbor(html):
+    """
+    Lexbor version of parse_recipe_content, taking the raw page HTML.
+    """
+    tree = LexborHTMLParser(html)
+    content_div = tree.css_first(SEL_CONTENT)
+    if not content_div:
+        return None
+
+    desc_fragments = []
+    for p in content_div.css('p:not(.gz-translation-link)'):
+        desc_fragments.extend(lexbor_text_fragments(p))
+
+    related = []
+    for r in content_div.css('li'):
+        r_fragments = lexbor_text_fragments(r)
+        r_name = r_fragments[0] if r_fragments else None
+        a_tag = r.css_first('a')
+        r_url = a_tag.attributes.get('href') if a_tag else None
+        if r_name and r_url:
+            related.append({"name": r_name.strip(), "url": r_url})
+
+    return {
+        "description": join_description(desc_fragments),
+        "ingredients": parse_ingredients_lexbor(tree),
+        "instructions": parse_instructions_lexbor(tree),
+        "related_recipes": related,
+    }
+
+async def fetch_html(session, url, min_size=0):
+    """
+    Downloads a page and returns its body as text.
+    
+    Connection errors, timeouts and 429/5xx responses are retried up to
+    FETCH_ATTEMPTS times, with a growing delay. Non-2xx responses and bodies
+    smaller than `min_size` bytes are rejected before any parsing work is
+    spent on them.
+    
+    Args:
+        session: Shared aiohttp.ClientSession
+        url (str): Page URL
+        min_size (int): Minimum plausible body size
+        
+    Returns:
+        str: Page HTML or None if the response was rejected.
+    """
+    for attempt in range(1, FETCH_ATTEMPTS + 1):
+        last_attempt = attempt == FETCH_ATTEMPTS
+        try:
+            async with session.get(url) as response:
+                retryable = response.status == 429 or response.status >= 500
+                if not retryable or last_attempt:
+                    return await read_html(response, url, min_size)
+                logging.warning("Retrying %s: HTTP %s (attempt %d/%d)", url, response.status, attempt, FETCH_ATTEMPTS)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if last_attempt:
+                raise
+            logging.warning("Retrying %s: %r (attempt %d/%d)", url, e, attempt, FETCH_ATTEMPTS)
+        await asyncio.sleep(RETRY_DELAY * attempt)
+
+async def read_html(response, url, min_size):
+    """
+    Reads the body of a response, see fetch_html.
+    """
+    if not 200 <= response.status < 300:
+        logging.warning("Skipping %s: HTTP %s", url, response.status)
+        return None
+    # Content-Length lets us skip reading the body at all, but only when it
+    # is the decoded size: a compressed body is checked after decoding below
+    if ('Content-Encoding' not in response.headers and response.content_length is not None
+            and response.content_length < min_size):
+        logging.warning("Skipping %s: body too small (%d bytes)", url, response.content_length)
+        return None
+    if response.url.host not in encoding_checked_hosts:
+        encoding_checked_hosts.add(response.url.host)
+        logging.info("%s responds with Content-Encoding: %s", response.url.host,
+                     response.headers.get('Content-Encoding', 'none'))
+    html = await response.text()
+    if len(html) < min_size:
+        logging.warning("Skipping %s: body too small (%d bytes)", url, len(html))
+        return None
+    return html
+
+async def warm_up(session, throttle, urls):
+    """
+    Opens a pooled connection to each host up front with a HEAD request, so
+    the DNS lookup and TLS handshake are done before the crawl starts.
+    Failures are ignored: the crawl itself will retry the connection.
+    """
+    async def head(url):
+        try:
+            async with throttle:
+                async with session.head(url) as response:
+                    logging.debug("Warmed up %s (HTTP %s)", url, response.status)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.debug("Warm-up of %s failed: %r", url, e)
+    await asyncio.gather(*[head(url) for url in urls])
+
+def parse_recipe_page(html, url, title, card_meta, scraped_at):
+    """
+    Parses a downloaded recipe page into the final flat recipe object.
+    
+    Runs in a worker thread, see scrape_recipe_detail.
     
-    return " ".join(steps)
+    Returns:
+        dict: Complete recipe object or None if the page has no recipe content.
+    """
+    if LexborHTMLParser is not None:
+        content = parse_recipe_content_lexbor(html)
+    else:
+        content = parse_recipe_content(Selector(html, url=url))
+    if not content:
+        return None
 
-def scrape_recipe_detail(session, url, title, card_meta):
+    # Build final flat object
+    recipe_data = {
+        "title": title.strip() if title else "Untitled",
+        "url": url,
+        **content,
+        "scraped_at": scraped_at,
+        # Flattened Metadata
+        "category": card_meta.get("category"),
+        "prep_time": card_meta.get("prep_time"),
+        "calories": card_meta.get("calories"),
+        "difficulty": card_meta.get("rating") # Renamed from rating to difficulty
+    }
+
+    return recipe_data
+
+async def scrape_recipe_detail(session, throttle, url, title, card_meta, scraped_at):
     """
     Fetches and parses the full details of a single recipe.
     
     Combines scraped data with metadata from the list page into a flat structure.
     
     Args:
-        session: Active FetcherSession
+        session: Shared aiohttp.ClientSession
+        throttle (Throttle): Shared request rate/concurrency limiter
         url (str): Recipe URL
         title (str): Recipe title
         card_meta (dict): Metadata scraped from the list card
+        scraped_at (datetime): Scrape time (UTC) of the list page, stored as a BSON Date
         
     Returns:
         dict: Complete recipe object or None if scraping fails.
     """
     try:
-        response = session.get(url)
-        time.sleep(1.2) # Polite delay to respect server
-        
-        content_div = response.css_first('div.gz-content-recipe.gz-mBottom4x')
-        if not content_div:
+        async with throttle:
+            html = await fetch_html(session, url, MIN_RECIPE_PAGE_SIZE)
+        if html is None:
             return None
-
-        # Description extraction: Remove trailing colons from the last fragment
-        desc_fragments = content_div.css('p:not(.gz-translation-link) ::text').get_all()
-        if desc_fragments:
-            desc_fragments[-1] = desc_fragments[-1].replace(":", "")
-        full_description = clean_data(" ".join(desc_fragments))
-
-        # Related Recipes extraction
-        related = []
-        related_section = content_div.css('li')
-        for r in related_section:
-            r_name = r.css('::text').get()
-            a_tag = r.css_first('a')
-            r_url = a_tag.attrib.get('href') if a_tag else None
-            if r_name and r_url:
-                related.append({"name": r_name.strip(), "url": r_url})
-
-        # Build final flat object
-        recipe_data = {
-            "title": title.strip() if title else "Untitled",
-            "url": url,
-            "description": full_description,
-            "ingredients": parse_ingredients(response),
-            "instructions": parse_instructions(response),
-            "related_recipes": related,
-            "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-            # Flattened Metadata
-            "category": card_meta.get("category"),
-            "prep_time": card_meta.get("prep_time"),
-            "calories": card_meta.get("calories"),
-            "difficulty": card_meta.get("rating") # Renamed from rating to difficulty
-        }
-
-        return recipe_data
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, parse_recipe_page, html, url, title, card_meta, scraped_at)
     except Exception as e:
-        logging.error(f"Error scraping detail page {url}: {e}")
+        logging.error("Error scraping detail page %s: %s", url, e)
         return None
 
-def get_list_page_data(session, url, base_url):
+def parse_list_page(html, url, base_url):
     """
     Parses a category list page to extract recipe links and metadata.
     
     Returns:
         tuple: (list of recipe dicts, next_page_url)
     """
-    try:
-        response = session.get(url)
-        cards = response.css('article.gz-card')
-        
-        page_recipes = []
-        for card in cards:
-            title_node = card.css_first('h2.gz-title a')
-            if not title_node: continue
-            
-            recipe_title = title_node.text
-            recipe_url = urljoin(base_url, title_node.attrib.get('href'))
-            
-            # Default values
-            prep_time, calories, rating = "Not Available", "Not Available", "Not Available"
-            footer_items = card.css('li.gz-single-data-recipe')
-            
-            # Parse footer items (time, kcal, difficulty) based on content content
-            for item in footer_items:
-                clean_text_val = "".join(item.css('::text').get_all()).strip()
-                if "min" in clean_text_val or "h" in clean_text_val:
-                    prep_time = clean_text_val
-                elif "Kcal" in clean_text_val:
-                    calories = clean_text_val.replace("Kcal", "").replace(",", ".").strip()
-                else:
-                    try:
-                        # Attempt to parse difficulty rating as a number
-                        val = clean_text_val.replace(',', '.').strip()
-                        float(val)
-                        rating = val
-                    except ValueError: pass
-
-            meta = {
-                "category": (card.css('div.gz-category ::text').get() or "Not Available").strip(),
-                "prep_time": prep_time,
-                "calories": calories,
-                "rating": rating
-            }
-            page_recipes.append({"title": recipe_title, "url": recipe_url, "meta": meta})
+    response = Selector(html, url=url)
+    cards = response.css('article.gz-card')
+    
+    page_recipes = []
+    for card in cards:
+        title_node = card.css_first('h2.gz-title a')
+        if not title_node: continue
         
-        next_node = response.css_first('a.gz-arrow.next')
-        next_url = urljoin(base_url, next_node.attrib.get('href')) if next_node else None
+        recipe_title = title_node.text
+        recipe_url = absolute_url(base_url, title_node.attrib.get('href'))
         
-        return page_recipes, next_url
+        # Parse footer items (time, kcal, difficulty) based on content
+        footer_items = [
+            "".join(item.css('::text').get_all()).strip()
+            for item in card.css('li.gz-single-data-recipe')
+        ]
+        prep_time, calories, rating = parse_footer(footer_items)
+
+        meta = {
+            "category": (card.css('div.gz-category ::text').get() or "Not Available").strip(),
+            "prep_time": prep_time,
+            "calories": calories,
+            "rating": rating
+        }
+        page_recipes.append({"title": recipe_title, "url": recipe_url, "meta": meta})
+    
+    next_node = response.css_first('a.gz-arrow.next')
+    next_url = absolute_url(base_url, next_node.attrib.get('href')) if next_node else None
+    
+    return page_recipes, next_url
+
+async def get_list_page_data(session, throttle, url, base_url):
+    """
+    Fetches a category list page and extracts recipe links and metadata.
+    
+    Returns:
+        tuple: (list of recipe dicts, next_page_url)
+    """
+    try:
+        async with throttle:
+            html = await fetch_html(session, url)
+        if html is None:
+            return [], None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, parse_list_page, html, url, base_url)
     except Exception as e:
-        logging.error(f"Error on list page {url}: {e}")
+        logging.error("Error on list page %s: %s", url, e)
         return [], None
 
+async def prefetch_list_pages(session, throttle, start_url, base_url, queue):
+    """
+    Follows the list page pagination and feeds the parsed pages into `queue`.
+    
+    Runs as a background task, so the next list pages download while the
+    detail pages of the current one are still in flight. The bounded queue
+    limits how far ahead it speculates. Puts None after the last page.
+    """
+    current_url = start_url
+    while current_url:
+        recipe_links, next_page = await get_list_page_data(session, throttle, current_url, base_url)
+        await queue.put((current_url, recipe_links))
+        if not recipe_links:
+            break
+        current_url = next_page
+    await queue.put(None)
+
+def write_batch(batch):
+    """
+    Upserts a batch of scraped recipes into MongoDB and marks the written
+    recipes 'done' in the frontier ('failed' for rejected ones).
+    
+    Each recipe is written with $setOnInsert keyed on its URL, so a recipe
+    stored meanwhile (e.g. by a concurrent run) is left untouched instead of
+    raising a duplicate key error. The unordered bulk write sends the whole
+    batch at once and pays a single acknowledgement per batch.
+    """
+    urls = [data["url"] for data in batch]
+    requests = [
+        UpdateOne({"url": data["url"]}, {"$setOnInsert": data}, upsert=True)
+        for data in batch
+    ]
+    failed = set()
+    try:
+        result = collection.bulk_write(requests, ordered=False)
+        logging.info("Successfully inserted %d recipes", result.upserted_count)
+        if result.matched_count:
+            logging.info("Skipped %d recipes already in DB", result.matched_count)
+    except BulkWriteError as e:
+        details = e.details
+        logging.info("Successfully inserted %d recipes", details['nUpserted'])
+        for error in details['writeErrors']:
+            failed.add(error['op']['q']['url'])
+            logging.error("Failed to insert %s: %s", error['op']['q']['url'], error['errmsg'])
+    except PyMongoError as e:
+        # Nothing is known to be written: the claims stay 'in-progress' and
+        # release_stale_claims puts them back in the queue on a later run
+        logging.error("Failed to write %d recipes: %s", len(urls), e)
+        return
+
+    mark_frontier([url for url in urls if url not in failed], "done")
+    mark_frontier(list(failed), "failed")
+
+async def flush_buffer(buffer):
+    """
+    Empties the buffer and writes its recipes from a worker thread, so the
+    MongoDB round-trips never block the event loop.
+    """
+    if not buffer:
+        return
+    batch = buffer[:]
+    buffer.clear()
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, write_batch, batch)
+
+def find_existing_urls(urls):
+    """
+    Returns the subset of `urls` already stored in the recipes collection.
+    
+    A single $in query checks the whole page in one round-trip. It is covered
+    by the url index: only the url field is projected, so no recipe document
+    is ever loaded or sent back.
+    """
+    return {
+        doc['url']
+        for doc in collection.find({"url": {"$in": urls}}, {"url": 1, "_id": 0}).hint([("url", 1)])
+    }
+
+# --- URL FRONTIER ---
+
+def enqueue_recipes(entries):
+    """
+    Queues list page entries in the frontier as 'pending'.
+    
+    All entries share one timestamp, stored as their scraped_at. Entries left
+    'done' or 'failed' by a previous run (e.g. a recipe that failed
+    MAX_SCRAPE_ATTEMPTS times, or whose write was rejected) are queued again
+    with a fresh attempt count: they are only passed here when the recipe is
+    missing from the database.
+    """
+    now = datetime.now(timezone.utc)
+    requests = [
+        UpdateOne(
+            {"url": entry['url'], "status": {"$in": ["done", "failed"]}},
+            {
+                "$set": {"title": entry['title'], "meta": entry['meta'], "status": "pending",
+                         "scraped_at": now, "attempts": 0},
+                "$setOnInsert": {"discovered_at": now},
+            },
+            upsert=True,
+        )
+        for entry in entries
+    ]
+    try:
+        frontier.bulk_write(requests, ordered=False)
+    except BulkWriteError as e:
+        # Duplicate keys are URLs already pending or claimed by a worker
+        for error in e.details['writeErrors']:
+            if error['code'] != 11000:
+                logging.error("Failed to queue %s: %s", error['op']['q']['url'], error['errmsg'])
+
+def release_stale_claims():
+    """
+    Puts recipes claimed by a run that crashed back in the queue.
+    """
+    result = frontier.update_many(
+        {"status": "in-progress", "claimed_at": {"$lt": datetime.now(timezone.utc) - CLAIM_TIMEOUT}},
+        {"$set": {"status": "pending"}, "$unset": {"worker_id": "", "claimed_at": ""}},
+    )
+    if result.modified_count:
+        logging.info("Released %d stale claims", result.modified_count)
+
+def claim_next(worker_id):
+    """
+    Atomically claims the oldest pending recipe of the frontier, counting
+    the claim as one more scrape attempt.
+    
+    Returns:
+        dict: The claimed frontier document, or None if nothing is pending.
+    """
+    return frontier.find_one_and_update(
+        {"status": "pending"},
+        {
+            "$set": {"status": "in-progress", "worker_id": worker_id, "claimed_at": datetime.now(timezone.utc)},
+            "$inc": {"attempts": 1},
+        },
+        sort=[("discovered_at", 1)],
+        return_document=ReturnDocument.AFTER,
+    )
+
+def mark_frontier(urls, status):
+    """Sets the frontier status of the given recipe URLs."""
+    if urls:
+        frontier.update_many({"url": {"$in": urls}}, {"$set": {"status": status}})
+
+def release_failed_claim(entry):
+    """
+    Puts a recipe whose scrape failed back in the queue, or marks it 'failed'
+    once it has used up its MAX_SCRAPE_ATTEMPTS.
+    """
+    if entry['attempts'] < MAX_SCRAPE_ATTEMPTS:
+        logging.info("Re-queueing %s (attempt %d/%d failed)", entry['url'], entry['attempts'], MAX_SCRAPE_ATTEMPTS)
+        status = "pending"
+    else:
+        status = "failed"
+    frontier.update_one(
+        {"_id": entry['_id']},
+        {"$set": {"status": status}, "$unset": {"worker_id": "", "claimed_at": ""}},
+    )
+
+async def frontier_worker(session, throttle, buffer, discovery_done, worker_id):
+    """
+    Scrapes recipes claimed from the frontier until it is empty and the list
+    page discovery is over.
+    
+    Args:
+        session: Shared aiohttp.ClientSession
+        throttle (Throttle): Shared request rate/concurrency limiter
+        buffer (list): Scraped recipes waiting for the next bulk write
+        discovery_done (asyncio.Event): Set once no more recipes will be queued
+        worker_id (str): Identifies the worker in the claimed documents
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        entry = await loop.run_in_executor(None, claim_next, worker_id)
+        if entry is None:
+            if discovery_done.is_set():
+                return
+            await asyncio.sleep(FRONTIER_POLL_INTERVAL)
+            continue
+
+        data = await scrape_recipe_detail(session, throttle, entry['url'], entry['title'], entry['meta'],
+                                          entry['scraped_at'])
+        if not data:
+            await loop.run_in_executor(None, release_failed_claim, entry)
+            continue
+
+        # Buffered recipes are marked 'done' once they are written
+        buffer.append(data)
+        if len(buffer) >= INSERT_BATCH_SIZE:
+            await flush_buffer(buffer)
+
 # --- MAIN EXECUTION ---
 
-def main():
+async def main():
     base_domain = "https://www.giallozafferano.it"
     # Starting point: Main recipe category page
-    current_url = urljoin(base_domain, "ricette-cat/")
+    start_url = urljoin(base_domain, "ricette-cat/")
     
     # Flag to stop pagination if we hit an existing recipe
     stop_scraping = False
+    queued_count = 0
+
+    throttle = Throttle(MAX_CONCURRENT_REQUESTS, REQUEST_INTERVAL)
+    buffer = []
+    queue = asyncio.Queue(maxsize=LIST_PAGE_PREFETCH)
+    discovery_done = asyncio.Event()
+    # Every MongoDB call runs in the default executor, off the event loop
+    loop = asyncio.get_running_loop()
+
+    # Resume the work left in the frontier by interrupted runs
+    await loop.run_in_executor(None, release_stale_claims)
 
-    with FetcherSession() as session:
-        while current_url and not stop_scraping:
-            logging.info(f"Checking Page: {current_url}")
-            recipe_links, next_page = get_list_page_data(session, current_url, base_domain)
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONCURRENT_REQUESTS,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector, timeout=timeout) as session:
+        # List pages live on www., recipe pages on ricette.
+        await warm_up(session, throttle, [base_domain, "https://ricette.giallozafferano.it/"])
+        
+        worker_prefix = f"{socket.gethostname()}-{os.getpid()}"
+        workers = [
+            asyncio.create_task(
+                frontier_worker(session, throttle, buffer, discovery_done, f"{worker_prefix}-{i}")
+            )
+            for i in range(WORKER_COUNT)
+        ]
+        prefetcher = asyncio.create_task(
+            prefetch_list_pages(session, throttle, start_url, base_domain, queue)
+        )
+        while not stop_scraping:
+            page = await queue.get()
+            if page is None:
+                break
+            current_url, recipe_links = page
+            logging.info("Checking Page: %s", current_url)
             
             if not recipe_links:
                 break
 
+            # 1. Collect the new recipes, up to the first one already in MongoDB
+            urls = [entry['url'] for entry in recipe_links]
+            existing = await loop.run_in_executor(None, find_existing_urls, urls)
+            
+            new_entries = []
             for entry in recipe_links:
-                # 1. Check if the URL already exists in MongoDB
-                if collection.find_one({"url": entry['url']}):
-                    logging.info(f"Found match in DB for '{entry['title']}'. Stopping incremental scrape.")
+                if entry['url'] in existing:
+                    logging.info("Found match in DB for '%s'. Stopping incremental scrape.", entry['title'])
                     stop_scraping = True
                     break # Exit the recipe loop
-                
-                # 2. If it's new, scrape the details
-                logging.info(f"Scraping NEW recipe: {entry['title']}")
-                data = scrape_recipe_detail(session, entry['url'], entry['title'], entry['meta'])
-                
-                # 3. Insert immediately into MongoDB
-                if data:
-                    collection.insert_one(data)
-                    logging.info(f"Successfully inserted: {entry['title']}")
+                logging.debug("Queueing NEW recipe: %s", entry['title'])
+                new_entries.append(entry)
             
-            current_url = next_page
-            time.sleep(2) # Prevent rate limiting
+            # 2. Queue them in the frontier, where the workers pick them up.
+            # Progress is logged once per page rather than once per recipe.
+            if new_entries:
+                await loop.run_in_executor(None, enqueue_recipes, new_entries)
+                queued_count += len(new_entries)
+                logging.info("Queued %d NEW recipes (%d so far)", len(new_entries), queued_count)
+
+        # Stop speculating on list pages we will not process
+        prefetcher.cancel()
+        await asyncio.gather(prefetcher, return_exceptions=True)
+
+        # 3. Let the workers drain the frontier
+        discovery_done.set()
+        await asyncio.gather(*workers)
+
+    # Save whatever is left in the buffer
+    await flush_buffer(buffer)
 
     logging.info("Scrape finished. Database is up to date.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""
+Unit tests for the _fast text helpers.
+
+Run with: python -m unittest
+"""
+
+import unittest
+from urllib.parse import urljoin
+
+from _fast import absolute_url, clean_data, parse_footer
+
+NA = "Not Available"
+
+
+class ParseFooterTest(unittest.TestCase):
+    # Footer items as found on the list cards of recipes in recipes_full.json
+
+    def test_full_footer(self):
+        self.assertEqual(parse_footer(["2", "46 min", "543 Kcal"]), ("46 min", "543", "2"))
+
+    def test_hours_and_minutes(self):
+        self.assertEqual(parse_footer(["2", "1 h 15 min", "402 Kcal"]), ("1 h 15 min", "402", "2"))
+
+    def test_time_keeps_whole_item_text(self):
+        self.assertEqual(parse_footer(["2", "30 min prep", "611 Kcal"]), ("30 min prep", "611", "2"))
+        self.assertEqual(parse_footer(["1 h e 30 min"])[0], "1 h e 30 min")
+
+    def test_missing_calories(self):
+        self.assertEqual(parse_footer(["3", "5 h"]), ("5 h", NA, "3"))
+
+    def test_decimal_comma(self):
+        self.assertEqual(parse_footer(["4,5", "1,234 Kcal"]), (NA, "1.234", "4.5"))
+
+    def test_non_numeric_items_are_not_ratings(self):
+        self.assertEqual(parse_footer(["Facile", "4 porzioni", "25 min"]), ("25 min", NA, NA))
+
+    def test_empty_footer(self):
+        self.assertEqual(parse_footer([]), (NA, NA, NA))
+
+
+def old_clean_data(text):
+    # clean_data as it was before the regex rewrite
+    if not text:
+        return ""
+    return " ".join(text.split()).replace(" .", ".").replace(" ,", ",")
+
+
+class CleanDataTest(unittest.TestCase):
+
+    def test_matches_old_implementation(self):
+        for text in [
+            None,
+            "",
+            "   ",
+            "Uova",
+            "  Latte \n\t intero  ",
+            "Mescolate , poi lasciate riposare .",
+            "Aggiungete sale ,  pepe  .  Servite",
+            "Cuocere a 180 °C per 30 min .\n",
+            "q.b.",
+            "1 , 5 kg",
+        ]:
+            with self.subTest(text=text):
+                self.assertEqual(clean_data(text), old_clean_data(text))
+
+
+class AbsoluteUrlTest(unittest.TestCase):
+    BASE_URL = "https://www.giallozafferano.it"
+
+    def test_matches_urljoin(self):
+        for href in [
+            "/ricette-cat/page2/",
+            "/ricette-cat/page2/?sort=new",
+            "/ricette-cat/#lista",
+            "//ricette.giallozafferano.it/Tiramisu.html",
+            "/./ricette-cat/",
+            "/ricette-cat/./page2/",
+            "/ricette-cat/../ricette/",
+            "/../ricette-cat/",
+            "https://ricette.giallozafferano.it/Tiramisu.html",
+            "page3/",
+            "?page=2",
+            "#top",
+            "",
+            None,
+        ]:
+            with self.subTest(href=href):
+                self.assertEqual(absolute_url(self.BASE_URL, href), urljoin(self.BASE_URL, href))
+
+
+if __name__ == "__main__":
+    unittest.main()
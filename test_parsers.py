@@ -0,0 +1,70 @@
+"""
+Checks that the scrapling and selectolax (Lexbor) recipe page parsers
+extract the same data.
+
+Run with: python -m unittest
+"""
+
+import unittest
+from unittest import mock
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# The scraper connects to MongoDB and creates its indexes at import time
+with mock.patch("pymongo.MongoClient"):
+    import giallozafferano_scraper as scraper
+
+from scrapling.parser import Selector
+
+# Trimmed-down recipe page, with the markup that makes lxml's `.text`
+# (text before the first child element) differ from the full text
+RECIPE_PAGE = """<html><body>
+<div class="gz-content-recipe gz-mBottom4x">
+  <p>La <b>crema pasticcera</b> è una crema dolce , perfetta per farcire .</p>
+  <p class="gz-translation-link">Read in English</p>
+  <p>Ecco gli ingredienti:</p>
+  <ul>
+    <li><a href="/ricette/Bigne.html">Bignè</a></li>
+    <li>Zeppole <a href="/ricette/Zeppole.html">di San Giuseppe</a></li>
+  </ul>
+</div>
+<dl class="gz-list-ingredients">
+  <dt class="gz-title-ingredients">Per <b>la</b> crema</dt>
+  <dd class="gz-ingredient"><a href="#">Uova <em>medie</em></a> <span>2 <b>medie</b> circa</span></dd>
+  <dd class="gz-ingredient"><a href="#">Latte intero</a> <span>
+    500 g
+  </span></dd>
+  <dd class="gz-ingredient"><a href="#">Sale</a></dd>
+</dl>
+<dl class="gz-list-ingredients">
+  <dt class="gz-title-ingredients"><b>Per decorare</b></dt>
+  <dd class="gz-ingredient"><span>q.b.</span></dd>
+</dl>
+<div class="gz-content-recipe-step">
+  <span class="num-step">1</span>Scaldate il <a href="#">latte</a> in un tegame .
+  <p>Unite le uova , <b>mescolando</b> bene.</p>
+</div>
+<div class="gz-content-recipe-step"><p><span class="num-step">2</span>Lasciate raffreddare.</p></div>
+</body></html>"""
+
+
+@unittest.skipIf(LexborHTMLParser is None, "selectolax is not installed")
+class ParserParityTest(unittest.TestCase):
+
+    def test_same_output(self):
+        self.assertEqual(
+            scraper.parse_recipe_content_lexbor(RECIPE_PAGE),
+            scraper.parse_recipe_content(Selector(RECIPE_PAGE)),
+        )
+
+    def test_no_recipe_content(self):
+        html = "<html><body><p>Pagina non trovata</p></body></html>"
+        self.assertIsNone(scraper.parse_recipe_content_lexbor(html))
+        self.assertIsNone(scraper.parse_recipe_content(Selector(html)))
+
+
+if __name__ == "__main__":
+    unittest.main()